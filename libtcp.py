@@ -37,10 +37,185 @@ sleep() : sleep the remaining time to keep the loop running at Hz
 """
 
 import socket
-import json
-import struct
 import atexit
-import random
+import selectors
+import asyncio
+import logging
+
+# 'orjson' is a drop-in replacement for the standard 'json' module that parses
+# and serializes several times faster and works directly with utf-8 bytes. Fall
+# back to the standard library when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 'uvloop' is a faster, libuv-based asyncio event loop used by AsyncTCPServer
+# when installed. The default asyncio loop is used otherwise.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Module logger; lazy %-style arguments keep disabled log calls nearly free
+logger = logging.getLogger(__name__)
+
+# Fields every JSON header must carry; checked with a single set-subset test
+_REQUIRED_HEADERS = frozenset(('is_big_endian', 'content-type', 'content-encoding', 'content-length'))
+
+
+def _encode_json(obj, encoding):
+    """ Encodes a dictionary into JSON bytes in the given encoding. """
+    if orjson is not None and encoding == 'utf-8':
+        return orjson.dumps(obj)
+    # Deferred so the stdlib codec is only loaded when actually needed
+    import json
+    return json.dumps(obj, ensure_ascii=False).encode(encoding)
+
+
+def _decode_json(data, encoding):
+    """ Decodes JSON bytes in the given encoding into Python data. """
+    if orjson is not None and encoding == 'utf-8':
+        return orjson.loads(data)
+    # Deferred so the stdlib codec is only loaded when actually needed
+    import json
+    return json.loads(bytes(data).decode(encoding))
+
+
+class _JSONHeader:
+    """ Decoded JSON header fields for one message.
+
+    A fixed attribute set is cheaper to fill and to read back than a general
+    dict keyed by strings for the four known header fields.
+    """
+    __slots__ = ('is_big_endian', 'content_type', 'content_encoding', 'content_length')
+
+
+def _scan_value_start(buffer, start, end, key):
+    """ Returns the index of the value following 'key' and its colon, or -1. """
+    i = buffer.find(key, start, end)
+    if i < 0:
+        return -1
+    i = buffer.find(b':', i + len(key), end)
+    if i < 0:
+        return -1
+    i += 1
+    while i < end and buffer[i] in b' \t':
+        i += 1
+    return i
+
+
+def _scan_int(buffer, start, end, key):
+    """ Parses the non-negative integer value of 'key', or None. """
+    i = _scan_value_start(buffer, start, end, key)
+    if i < 0:
+        return None
+    j = i
+    while j < end and 48 <= buffer[j] <= 57:
+        j += 1
+    if j == i:
+        return None
+    return int(buffer[i:j])
+
+
+def _scan_string(buffer, start, end, key):
+    """ Parses the string value of 'key', or None. """
+    i = _scan_value_start(buffer, start, end, key)
+    if i < 0 or i >= end or buffer[i] != 34:
+        return None
+    j = buffer.find(b'"', i + 1, end)
+    if j < 0:
+        return None
+    raw = buffer[i + 1:j]
+    if b'\\' in raw:
+        # Escaped strings are rare; let the general decoder handle them
+        return None
+    return raw.decode('utf-8')
+
+
+def _scan_bool(buffer, start, end, key):
+    """ Parses the true/false value of 'key', or None. """
+    i = _scan_value_start(buffer, start, end, key)
+    if i < 0:
+        return None
+    if buffer.startswith(b'true', i, end):
+        return True
+    if buffer.startswith(b'false', i, end):
+        return False
+    return None
+
+
+def _scan_json_header(buffer, start, end):
+    """ Parses the four known header fields without a general JSON decode.
+
+    The JSON header carries the same four scalar fields on every message, so
+    scanning for each key and parsing its value in place is cheaper than
+    building a dict through the JSON codec. Returns a _JSONHeader, or None
+    when the encoded header does not match the expected shape — the caller
+    then falls back to the full decode.
+    """
+    header = _JSONHeader()
+    header.is_big_endian = _scan_bool(buffer, start, end, b'"is_big_endian"')
+    header.content_type = _scan_string(buffer, start, end, b'"content-type"')
+    header.content_encoding = _scan_string(buffer, start, end, b'"content-encoding"')
+    header.content_length = _scan_int(buffer, start, end, b'"content-length"')
+    if (header.is_big_endian is None or header.content_type is None
+            or header.content_encoding is None or header.content_length is None):
+        return None
+    return header
+
+
+def _parse_frame(buffer, pos):
+    """ Parses one message frame from 'buffer' starting at 'pos'.
+
+    Fuses the protocol-header, JSON-header, and content framing steps into a
+    single pass so a complete message costs one function call instead of a
+    multi-step state machine re-dispatched on every read.
+
+    Parameters
+    ----------
+    buffer : bytearray
+        The receive buffer.
+    pos : int
+        The read cursor into the buffer.
+
+    Returns
+    -------
+    (json_header, content_view, new_pos) tuple. 'json_header' is a
+    _JSONHeader, or None until the JSON header is fully buffered;
+    'content_view' is None until the whole message is. 'new_pos' is the
+    cursor past the parsed frame, or the unchanged 'pos' while the frame is
+    incomplete. 'content_view' is a memoryview into the buffer and is only
+    valid until the buffer is next modified.
+    """
+    available = len(buffer) - pos
+    if available < 2:
+        return None, None, pos
+    # Big-endian unsigned short, read in place; indexing a bytearray is
+    # faster than struct or int.from_bytes for a 2-byte field
+    header_length = (buffer[pos] << 8) | buffer[pos + 1]
+    if available < 2 + header_length:
+        return None, None, pos
+    json_header = _scan_json_header(buffer, pos + 2, pos + 2 + header_length)
+    if json_header is None:
+        # Non-canonical header (escapes, unusual layout); take the slow path
+        header_view = memoryview(buffer)[pos + 2:pos + 2 + header_length]
+        decoded = _decode_json(header_view, 'utf-8')
+        header_view.release()
+        if not decoded.keys() >= _REQUIRED_HEADERS:
+            missing = _REQUIRED_HEADERS - decoded.keys()
+            raise ValueError('Missing required header(s) {0}.'.format(sorted(missing)))
+        json_header = _JSONHeader()
+        json_header.is_big_endian = decoded['is_big_endian']
+        json_header.content_type = decoded['content-type']
+        json_header.content_encoding = decoded['content-encoding']
+        json_header.content_length = decoded['content-length']
+    content_length = json_header.content_length
+    if available < 2 + header_length + content_length:
+        return json_header, None, pos
+    start = pos + 2 + header_length
+    content_view = memoryview(buffer)[start:start + content_length]
+    return json_header, content_view, start + content_length
 
 #==============================================================================#
 # Read Implementation
@@ -49,12 +224,40 @@ try:
     from tcp_impl import TCPImpl
 except ImportError as e:
     implementation_imported = False
-    print(e)
-    print("[INFO]: No TCP message implementation file. Using default values for messages. Must define the messages and functions found in 'tcp_impl.py'")
+    logger.info('%s', e)
+    logger.info("No TCP message implementation file. Using default values for messages. Must define the messages and functions found in 'tcp_impl.py'")
 else:
     implementation_imported = True
 
 
+#==============================================================================#
+# Socket Options
+#==============================================================================#
+def _configure_socket(sock, nodelay, send_buffer_size, receive_buffer_size):
+    """ Applies the latency and throughput socket options.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        The socket to configure.
+    nodelay : bool
+        If True, disable Nagle's algorithm (TCP_NODELAY) so small messages are
+        sent immediately instead of waiting to coalesce.
+    send_buffer_size : int or None
+        Kernel send buffer size in bytes (SO_SNDBUF), or None to keep the
+        system default.
+    receive_buffer_size : int or None
+        Kernel receive buffer size in bytes (SO_RCVBUF), or None to keep the
+        system default.
+    """
+    if nodelay:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if send_buffer_size is not None:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, send_buffer_size)
+    if receive_buffer_size is not None:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, receive_buffer_size)
+
+
 class TCP:
     def __init__(self, sock=None, receive_size=4096):
         self.socket = sock
@@ -64,54 +267,157 @@ class TCP:
         self.remote_address = self.socket.getpeername()
         self.remote_host = self.remote_address[0]
         self.remote_port = self.remote_address[1]
+        # Non-blocking socket: each read drains everything the kernel has
+        # queued, and a selector waits for readiness instead of spinning
+        self.socket.setblocking(False)
+        self._read_selector = selectors.DefaultSelector()
+        self._read_selector.register(self.socket, selectors.EVENT_READ)
+        self._write_selector = selectors.DefaultSelector()
+        self._write_selector.register(self.socket, selectors.EVENT_WRITE)
         self.receive_size = receive_size
-        self._recv_buffer = b''
-        self._send_buffer = b''
-        self._json_header_len = None
+        # Reusable landing area for 'recv_into' so each read does not allocate
+        # a fresh bytes object of up to 'receive_size'
+        self._recv_slab = bytearray(self.receive_size)
+        self._recv_buffer = bytearray()
+        self._recv_pos = 0
+        self._send_iov = []
+        # Pooled output buffer holding the protocol and JSON headers of the
+        # frame being sent, reused across messages (see _frame_message)
+        self._out_buf = bytearray(256)
         self.json_header = None
         self.content = None
+        # Cached outgoing JSON header bytes; only the content-length field
+        # changes between messages (see _build_json_header)
+        self._header_template = None
+        self._header_static = None
+        self._header_length_slice = None
 
         #======================================================================#
         # Create Messages
         #======================================================================#
         self.tcp_implementation = TCPImpl()
 
+        # Specialize the JSON codec for the common case: when the
+        # implementation declares utf-8 for both directions and orjson is
+        # available, bind codecs that skip the per-call encoding comparison
+        # and fallback branch entirely
+        if (orjson is not None
+                and self.tcp_implementation.request.content_encoding == 'utf-8'
+                and self.tcp_implementation.response.content_encoding == 'utf-8'):
+            self._json_encode = lambda obj, encoding='utf-8': orjson.dumps(obj)
+            self._json_decode = lambda json_bytes, encoding='utf-8': orjson.loads(json_bytes)
+
         # Closes the socket if the python script closes
         atexit.register(self.close)
 
     def read(self):
-        """ Reads raw data bytes from the socket. """
-        try:
-            data = self.socket.recv(self.receive_size)
-        except BlockingIOError:
-            pass
-        else:
-            if data:
-                self._recv_buffer += data
+        """ Reads raw data bytes from the socket.
+
+        Waits until the socket is readable, then drains the kernel receive
+        queue in a tight loop until the socket would block. Draining per
+        readiness event amortizes the syscall count on large messages and
+        picks up any further messages already queued in the kernel buffer.
+        """
+        self._read_selector.select()
+        while True:
+            try:
+                received = self.socket.recv_into(self._recv_slab)
+            except BlockingIOError:
+                break
+            if received:
+                self._recv_buffer += memoryview(self._recv_slab)[:received]
             else:
                 raise ConnectionClosedError('Peer closed at {0}:{1}'.format(self.remote_host, self.remote_port))
 
+    def _read_exact(self, length):
+        """ Reads exactly 'length' more bytes into the receive buffer.
+
+        Used once a message's total size is known: the buffer is grown to its
+        final size up front and filled with as few recv calls as the kernel
+        allows, instead of going through repeated read()/process_message()
+        rounds one receive-buffer chunk at a time.
+
+        Parameters
+        ----------
+        length : int
+            The number of bytes to read from the socket.
+        """
+        start = len(self._recv_buffer)
+        self._recv_buffer += bytes(length)
+        view = memoryview(self._recv_buffer)
+        filled = 0
+        while filled < length:
+            try:
+                received = self.socket.recv_into(view[start + filled:])
+            except BlockingIOError:
+                self._read_selector.select()
+                continue
+            if received == 0:
+                view.release()
+                del self._recv_buffer[start:]
+                raise ConnectionClosedError('Peer closed at {0}:{1}'.format(self.remote_host, self.remote_port))
+            filled += received
+        view.release()
+
     def write(self):
-        """ Sends data in buffer.
+        """ Sends the buffered message chunks.
+
+        The protocol header, JSON header, and content are kept as separate
+        chunks and handed to the kernel in one vectored 'sendmsg' call, so no
+        concatenated copy of the message is ever built in user space.
 
         Returns
         -------
-        True : if message is fully sent
-        False : if data is still in the buffer
+        'done' : if no buffered data remains
+        'partial' : if some data was sent but more remains
+        'blocked' : if the kernel send buffer is full
         """
-        if self._send_buffer:
-            try:
-                sent = self.socket.send(self._send_buffer)
-            except BlockingIOError:
-                return False
+        if not self._send_iov:
+            return 'done'
+        try:
+            sent = self.socket.sendmsg(self._send_iov)
+        except BlockingIOError:
+            return 'blocked'
+        self._consume_sent(sent)
+        return 'done' if not self._send_iov else 'partial'
+
+    def _consume_sent(self, sent):
+        """ Drops fully-sent chunks and trims any partially-sent one.
+
+        Parameters
+        ----------
+        sent : int
+            The number of bytes the kernel accepted from the staged chunks.
+        """
+        while sent:
+            chunk = self._send_iov[0]
+            if sent >= len(chunk):
+                sent -= len(chunk)
+                self._send_iov.pop(0)
             else:
-                self._send_buffer = self._send_buffer[sent:]
-                if sent and not self._send_buffer:
-                    # Message fully sent
-                    return True
-                else:
-                    # Message not fully sent yet
-                    return False
+                self._send_iov[0] = memoryview(chunk)[sent:]
+                sent = 0
+
+    def _buffered(self):
+        """ Returns the number of unread bytes in the receive buffer. """
+        return len(self._recv_buffer) - self._recv_pos
+
+    def _consume(self, length):
+        """ Advances the read cursor past processed bytes.
+
+        Advancing a cursor avoids reallocating and copying the whole buffer on
+        every processed header or message. The consumed prefix is trimmed off
+        periodically to keep the buffer from growing without bound.
+
+        Parameters
+        ----------
+        length : int
+            The number of bytes that have been processed.
+        """
+        self._recv_pos += length
+        if self._recv_pos > 65536 or self._recv_pos > len(self._recv_buffer) // 2:
+            del self._recv_buffer[:self._recv_pos]
+            self._recv_pos = 0
 
     def _json_encode(self, obj, encoding):
         """ Encode dictionary into JSON byte array.
@@ -127,7 +433,7 @@ class TCP:
         -------
         Array of bytes containing the JSON string encoded as specified.
         """
-        return json.dumps(obj, ensure_ascii=False).encode(encoding)
+        return _encode_json(obj, encoding)
 
     def _json_decode(self, json_bytes, encoding):
         """ Decode a dictionary from a JSON byte array.
@@ -139,7 +445,7 @@ class TCP:
         encoding : str
             The encoding type for the JSON text. Most common is 'utf-8'.
         """
-        return json.loads(json_bytes.decode(encoding))
+        return _decode_json(json_bytes, encoding)
 
     def _int_to_bytes(self, size):
         """ Convert Int into two raw bytes.
@@ -149,73 +455,184 @@ class TCP:
         size : int
             The size of the JSON header array.
         """
-        return struct.pack('>H', size)
+        return size.to_bytes(2, 'big')
 
-    def _bytes_to_int(self, bytes):
+    def _bytes_to_int(self, buffer, offset=0):
         """ Convert two bytes into an unsigned Int.
 
         Parameters
         ----------
-        bytes : byte array
-            The pair of bytes to be converted into an Int (JSON header size).
+        buffer : byte array
+            The buffer holding the pair of bytes to be converted into an Int
+            (JSON header size).
+        offset : int
+            The position of the pair of bytes within the buffer. Reading in
+            place avoids slicing a temporary bytes object out of the buffer.
         """
-        return struct.unpack('>H', bytes)[0]
-
-    def process_protocol_header(self):
-        """ Creates the protocol header bytes. """
-        header_length = 2
-        if len(self._recv_buffer) >= header_length:
-            self._json_header_len = self._bytes_to_int(self._recv_buffer[:header_length])
-            self._recv_buffer = self._recv_buffer[header_length:]
-
-    def process_json_header(self):
-        """ Creates the JSON header bytes. """
-        header_length = self._json_header_len
-        if (len(self._recv_buffer)) >= header_length:
-            self.json_header = self._json_decode(self._recv_buffer[:header_length], 'utf-8')
-            self._recv_buffer = self._recv_buffer[header_length:]
-            for required_header in ['is_big_endian', 'content-type', 'content-encoding', 'content-length']:
-                if required_header not in self.json_header:
-                    raise ValueError('Missing required header "{0}".'.format(required_header))
+        return (buffer[offset] << 8) | buffer[offset + 1]
 
-    def process_message(self):
-        """ Converts the receive buffer bytes into data. """
-        if self._json_header_len is None:
-            self.process_protocol_header()
+    def _build_json_header(self, is_big_endian, content_type, encoding, content_length):
+        """ Returns the encoded JSON header for an outgoing message.
 
-        if self._json_header_len is not None:
-            if self.json_header is None:
-                self.process_json_header()
+        The header fields other than 'content-length' never change from one
+        message to the next, so the encoded bytes are cached with a fixed
+        10-character length field and only the digits are patched in place per
+        message. The field is right-aligned and space-padded, which keeps the
+        header valid JSON. The cache is rebuilt if any of the static fields
+        change.
 
-        if self.json_header:
-            self.process_content()
+        Parameters
+        ----------
+        is_big_endian : bool
+            Whether multi-byte values in the content use big-endian order.
+        content_type : str
+            The MIME type of the message content.
+        encoding : str
+            The encoding type for the JSON text. Most common is 'utf-8'.
+        content_length : int
+            The size of the encoded message content in bytes.
+
+        Returns
+        -------
+        Byte array containing the encoded JSON header.
+        """
+        static = (is_big_endian, content_type, encoding)
+        if static != self._header_static:
+            static_fields = {
+                'is_big_endian': is_big_endian,
+                'content-type': content_type,
+                'content-encoding': encoding
+            }
+            # Drop the closing brace and append the fixed-width length field
+            template = bytearray(self._json_encode(static_fields, encoding))
+            del template[-1:]
+            template += b', "content-length": '
+            start = len(template)
+            template += b' ' * 10 + b'}'
+            self._header_template = template
+            self._header_length_slice = slice(start, start + 10)
+            self._header_static = static
+        digits = '{0:>10}'.format(content_length).encode('ascii')
+        if len(digits) != 10:
+            # Length does not fit the fixed-width field; encode a full header
+            return self._json_encode({
+                'is_big_endian': is_big_endian,
+                'content-type': content_type,
+                'content-encoding': encoding,
+                'content-length': content_length
+            }, encoding)
+        self._header_template[self._header_length_slice] = digits
+        return self._header_template
+
+    def _frame_message(self, is_big_endian, content_type, encoding, content):
+        """ Serializes a complete outgoing message into the send chunks.
+
+        The protocol header and JSON header are packed into a pooled,
+        per-connection bytearray that is reused from one message to the next,
+        so framing allocates nothing beyond the encoded content itself. The
+        staged chunks are placed on the send list consumed by write().
+
+        Parameters
+        ----------
+        is_big_endian : bool
+            Whether multi-byte values in the content use big-endian order.
+        content_type : str
+            The MIME type of the message content.
+        encoding : str
+            The encoding type for the JSON text. Most common is 'utf-8'.
+        content : dict or bytes
+            The message content. Dictionaries are JSON-encoded; bytes-like
+            content is sent as-is (pair with
+            content_type='application/octet-stream').
+        """
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            # Raw binary payload; skip the JSON pass entirely
+            content_bytes = content
+        else:
+            content_bytes = self._json_encode(content, encoding)
+        json_header_bytes = self._build_json_header(is_big_endian, content_type, encoding, len(content_bytes))
+        header_length = len(json_header_bytes)
+        total = 2 + header_length
+        if len(self._out_buf) < total:
+            self._out_buf += bytes(total - len(self._out_buf))
+        self._out_buf[0:2] = header_length.to_bytes(2, 'big')
+        self._out_buf[2:total] = json_header_bytes
+        self._send_iov = [memoryview(self._out_buf)[:total], content_bytes]
+
+    def process_message(self):
+        """ Converts the receive buffer bytes into data. """
+        json_header, content_view, new_pos = _parse_frame(self._recv_buffer, self._recv_pos)
+        if json_header is None:
+            return
+        self.json_header = json_header
+        if content_view is None:
+            # Content not fully buffered yet
+            return
+        self.process_content(content_view)
+        content_view.release()
+        self._consume(new_pos - self._recv_pos)
 
     def read_message(self):
         while self.content is None:
             self.read()
             self.process_message()
+            if self.content is None and self.json_header is not None:
+                # The header gives the exact number of bytes still owed for
+                # this message; fetch them in one targeted fill
+                header_length = self._bytes_to_int(self._recv_buffer, self._recv_pos)
+                frame_length = 2 + header_length + self.json_header.content_length
+                remaining = frame_length - self._buffered()
+                if remaining > 0:
+                    self._read_exact(remaining)
+                    self.process_message()
 
     def write_message(self):
         self.create_message()
-        successfully_sent = False
-        while not successfully_sent:
-            successfully_sent = self.write()
+        self._flush_send_iov()
+
+    def _flush_send_iov(self):
+        """ Sends the staged chunks until they are fully written.
+
+        On a blocking socket the whole frame goes to the kernel in a single
+        vectored call, with any short-write remainder finished by sendall,
+        which loops in C without returning to Python per partial send. On a
+        non-blocking socket partial progress is retried and backpressure
+        waits on the write selector.
+        """
+        if not self._send_iov:
+            return
+        if self.socket.getblocking():
+            sent = self.socket.sendmsg(self._send_iov)
+            self._consume_sent(sent)
+            if self._send_iov:
+                self.socket.sendall(b''.join(self._send_iov))
+                self._send_iov = []
+            return
+        while True:
+            state = self.write()
+            if state == 'done':
+                break
+            if state == 'blocked':
+                # Wait for the kernel send buffer to drain instead of spinning
+                self._write_selector.select()
 
     def close(self):
-        print('Closing connection:\n\t {0}:{1} --> {2}:{3}'.format(self.local_host, self.local_port, self.remote_host, self.remote_port))
+        logger.info('Closing connection: %s:%s --> %s:%s', self.local_host, self.local_port, self.remote_host, self.remote_port)
+        self._read_selector.close()
+        self._write_selector.close()
         self.socket.close()
 
     #==========================================================================#
     # Abstract Methods
     #==========================================================================#
-    def process_content(self):
+    def process_content(self, content_view):
         raise NotImplementedError()
 
     def create_message(self):
         raise NotImplementedError()
 
 class TCPServer(TCP):
-    def __init__(self, host='127.0.0.1', port=65432):
+    def __init__(self, host='127.0.0.1', port=65432, nodelay=True, send_buffer_size=1048576, receive_buffer_size=1048576, pipelining=False):
         #======================================================================#
         # Create Socket
         #======================================================================#
@@ -224,22 +641,34 @@ class TCPServer(TCP):
         self.server_port = port
         self.server_address = (self.server_host, self.server_port)
 
+        # Socket options applied to each accepted connection
+        self.nodelay = nodelay
+        self.send_buffer_size = send_buffer_size
+        self.receive_buffer_size = receive_buffer_size
+
+        # When pipelining, responses are queued while further requests are
+        # already buffered and sent together in one vectored write
+        self.pipelining = pipelining
+        self._pending_responses = []
+
         # Create listening socket
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        _configure_socket(self.server_socket, self.nodelay, self.send_buffer_size, self.receive_buffer_size)
         atexit.register(self.close_server)
 
         # Bind and listen
-        print('Establishing TCP server on {0}:{1}'.format(self.server_host, self.server_port))
+        logger.info('Establishing TCP server on %s:%s', self.server_host, self.server_port)
         self.server_socket.bind(self.server_address)
         self.server_socket.listen()
 
-        print('Waiting for connection...')
+        logger.info('Waiting for connection...')
         self.wait_for_connection()
 
     def wait_for_connection(self):
         self.connection, self.connection_address = self.server_socket.accept()
-        print('Server connected to {0}:{1}'.format(self.connection_address[0], self.connection_address[1]))
+        _configure_socket(self.connection, self.nodelay, self.send_buffer_size, self.receive_buffer_size)
+        logger.info('Server connected to %s:%s', self.connection_address[0], self.connection_address[1])
 
         # Initialize TCP connection socket object
         super().__init__(sock=self.connection)
@@ -264,36 +693,28 @@ class TCPServer(TCP):
             encoding = self.encoding
             content = {'content': 'content'}
 
-        # Encode response content
-        content_bytes = self._json_encode(content, encoding)
-
-        # Create JSON header
-        json_header = {
-            'is_big_endian': is_big_endian,
-            'content-type': content_type,
-            'content-encoding': encoding,
-            'content-length': len(content_bytes)
-        }
-
-        json_header_bytes = self._json_encode(json_header, encoding)
-
-        # Create protocol header
-        protocol_header_bytes = self._int_to_bytes(len(json_header_bytes))
-
-        self._send_buffer = protocol_header_bytes + json_header_bytes + content_bytes
+        # Frame the message into the pooled send chunks
+        self._frame_message(is_big_endian, content_type, encoding, content)
 
     #==========================================================================#
     # Define Request Interpretation
     #==========================================================================#
-    def process_content(self):
+    def process_content(self, content_view):
         """ Process the Request content.
 
         Processes the content bytes and performs the desired action with them.
+
+        Parameters
+        ----------
+        content_view : memoryview
+            View of the content bytes within the receive buffer. Only valid
+            for the duration of the call.
         """
-        content_length = self.json_header['content-length']
-        if len(self._recv_buffer) >= content_length:
-            self.content = self._json_decode(self._recv_buffer[:content_length], self.json_header['content-encoding'])
-            self._recv_buffer = self._recv_buffer[content_length:]
+        if self.json_header.content_type == 'application/octet-stream':
+            # Raw binary payload; skip the JSON pass entirely
+            self.content = bytes(content_view)
+        else:
+            self.content = self._json_decode(content_view, self.json_header.content_encoding)
 
     #==========================================================================#
     # Define State Flow
@@ -308,48 +729,165 @@ class TCPServer(TCP):
                 response_content = self.tcp_implementation.perform_service(self.content)
                 self.tcp_implementation.response.set_content(response_content)
 
-                # Send back response
-                self.write_message()
-
-                # Reset variables and start process over
-                self._send_buffer = b''
-                self._json_header_len = None
+                # Reset message state before checking for further requests
                 self.json_header = None
                 self.content = None
+
+                if self.pipelining:
+                    # Queue the response; if the client already pipelined the
+                    # next request into the buffer, service it before paying
+                    # for a send
+                    self.create_message()
+                    self._queue_response()
+                    self.process_message()
+                    if self.content is None:
+                        self._flush_responses()
+                else:
+                    # Send back response
+                    self.write_message()
             except KeyboardInterrupt:
                 break
             except ConnectionClosedError as err:
-                print('[Connection closed]: {0}'.format(err))
+                logger.info('[Connection closed]: %s', err)
                 self.reset()
-                print('Waiting for new connection...')
+                logger.info('Waiting for new connection...')
                 self.wait_for_connection()
 
+    def _queue_response(self):
+        """ Moves the staged response frame onto the pending list.
+
+        The staged chunks reference pooled buffers that the next
+        create_message will overwrite, so they are copied out before being
+        queued.
+        """
+        for chunk in self._send_iov:
+            self._pending_responses.append(bytes(chunk))
+        self._send_iov = []
+
+    def _flush_responses(self):
+        """ Sends all pending response frames in one vectored write. """
+        if self._pending_responses:
+            self._send_iov = self._pending_responses
+            self._pending_responses = []
+            self._flush_send_iov()
+
     def reset(self):
         """ Resets the variables and waits for re-connection. """
-        self._recv_buffer = b''
-        self._send_buffer = b''
-        self._json_header_len = None
+        self._recv_buffer = bytearray()
+        self._recv_pos = 0
+        self._send_iov = []
+        self._pending_responses = []
         self.json_header = None
         self.content = None
 
     def close_server(self):
         # Close the server socket
-        print('Closing server at {0}:{1}'.format(self.server_host, self.server_port))
+        logger.info('Closing server at %s:%s', self.server_host, self.server_port)
         self.server_socket.close()
 
+class AsyncTCPServer:
+    """ asyncio-based server that services many connections concurrently.
+
+    TCPServer holds a single connection at a time and blocks in its process
+    loop, so concurrency is capped at one client. This server multiplexes all
+    connections on one asyncio event loop (uvloop's libuv-based loop when
+    installed), running the same request/response cycle per connection and
+    backed by the same TCPImpl message definitions.
+    """
+    def __init__(self, host='127.0.0.1', port=65432, nodelay=True, send_buffer_size=1048576, receive_buffer_size=1048576):
+        self.server_host = host
+        self.server_port = port
+
+        # Socket options applied to each accepted connection
+        self.nodelay = nodelay
+        self.send_buffer_size = send_buffer_size
+        self.receive_buffer_size = receive_buffer_size
+
+        #======================================================================#
+        # Create Messages
+        #======================================================================#
+        self.tcp_implementation = TCPImpl()
+
+    async def serve(self):
+        """ Accepts and services connections until cancelled. """
+        server = await asyncio.start_server(self._handle_connection, self.server_host, self.server_port)
+        logger.info('Establishing TCP server on %s:%s', self.server_host, self.server_port)
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_connection(self, reader, writer):
+        """ Runs the request/response cycle for one connection. """
+        peer = writer.get_extra_info('peername')
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            _configure_socket(sock, self.nodelay, self.send_buffer_size, self.receive_buffer_size)
+        logger.info('Server connected to %s:%s', peer[0], peer[1])
+        try:
+            while True:
+                # Read request
+                protocol_header = await reader.readexactly(2)
+                header_length = int.from_bytes(protocol_header, 'big')
+                json_header = _decode_json(await reader.readexactly(header_length), 'utf-8')
+                if not json_header.keys() >= _REQUIRED_HEADERS:
+                    missing = _REQUIRED_HEADERS - json_header.keys()
+                    raise ValueError('Missing required header(s) {0}.'.format(sorted(missing)))
+                content_bytes = await reader.readexactly(json_header['content-length'])
+                if json_header['content-type'] == 'application/octet-stream':
+                    # Raw binary payload; skip the JSON pass entirely
+                    content = content_bytes
+                else:
+                    content = _decode_json(content_bytes, json_header['content-encoding'])
+
+                # Service
+                response_content = self.tcp_implementation.perform_service(content)
+                response = self.tcp_implementation.response
+                response.set_content(response_content)
+
+                # Send back response
+                encoding = response.content_encoding
+                response_content = response.get_content()
+                if isinstance(response_content, (bytes, bytearray, memoryview)):
+                    response_bytes = response_content
+                else:
+                    response_bytes = _encode_json(response_content, encoding)
+                json_header_bytes = _encode_json({
+                    'is_big_endian': response.is_big_endian,
+                    'content-type': response.content_type,
+                    'content-encoding': encoding,
+                    'content-length': len(response_bytes)
+                }, encoding)
+                writer.writelines([len(json_header_bytes).to_bytes(2, 'big'), json_header_bytes, response_bytes])
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError, BrokenPipeError):
+            pass
+        finally:
+            logger.info('Closing connection to %s:%s', peer[0], peer[1])
+            writer.close()
+            await writer.wait_closed()
+
+    def process_loop(self):
+        """ Runs the server event loop until interrupted. """
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
+
 class TCPClient(TCP):
-    def __init__(self, remote_host='127.0.0.1', remote_port=65432):
+    def __init__(self, remote_host='127.0.0.1', remote_port=65432, nodelay=True, send_buffer_size=1048576, receive_buffer_size=1048576):
         #======================================================================#
         # Create Socket
         #======================================================================#
         # Create client socket and connect to server (TCP, IPv4)
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        print('Connecting to server at {0}:{1}'.format(remote_host, remote_port))
+        _configure_socket(self.socket, nodelay, send_buffer_size, receive_buffer_size)
+        logger.info('Connecting to server at %s:%s', remote_host, remote_port)
         self.socket.connect((remote_host, remote_port))
 
         # Initialize TCP connection socket object
         super().__init__(self.socket)
-        print('Local socket at {0}:{1}'.format(self.local_host, self.local_port))
+        logger.info('Local socket at %s:%s', self.local_host, self.local_port)
 
     #==========================================================================#
     # Define Request Message
@@ -371,38 +909,30 @@ class TCPClient(TCP):
             encoding = self.encoding
             content = {'content': 'content'}
 
-        # Encode response content
-        content_bytes = self._json_encode(content, encoding)
-
-        # Create JSON header
-        json_header = {
-            'is_big_endian': is_big_endian,
-            'content-type': content_type,
-            'content-encoding': encoding,
-            'content-length': len(content_bytes)
-        }
-
-        json_header_bytes = self._json_encode(json_header, encoding)
-
-        # Create protocol header
-        protocol_header_bytes = self._int_to_bytes(len(json_header_bytes))
-
-        self._send_buffer = protocol_header_bytes + json_header_bytes + content_bytes
+        # Frame the message into the pooled send chunks
+        self._frame_message(is_big_endian, content_type, encoding, content)
 
     #==========================================================================#
     # Define Response Interpretation
     #==========================================================================#
-    def process_content(self):
+    def process_content(self, content_view):
         """ Process the Response content.
 
         Processes the content bytes and performs the desired action with them.
         The expected message should be a dictionary with the following
         structure:
+
+        Parameters
+        ----------
+        content_view : memoryview
+            View of the content bytes within the receive buffer. Only valid
+            for the duration of the call.
         """
-        content_length = self.json_header['content-length']
-        if len(self._recv_buffer) >= content_length:
-            self.content = self._json_decode(self._recv_buffer[:content_length], self.json_header['content-encoding'])
-            self._recv_buffer = self._recv_buffer[content_length:]
+        if self.json_header.content_type == 'application/octet-stream':
+            # Raw binary payload; skip the JSON pass entirely
+            self.content = bytes(content_view)
+        else:
+            self.content = self._json_decode(content_view, self.json_header.content_encoding)
 
     #==========================================================================#
     # Define State Flow
@@ -44,6 +44,10 @@ variable type. TCP messages are sent as JSON text and interpreted as
 dictionaries in Python. When writing the definitions, put the variable name and
 the variable type separated by a colon, following the dictionary format.
 
+For raw binary payloads, set content_type = 'application/octet-stream' on the
+message and use a bytes object as the content. The bytes are then sent and
+received as-is, skipping the JSON encode/decode step entirely.
+
 Use the following variable type names:
 --------------------------------------
 int: integer